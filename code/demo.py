@@ -4,7 +4,7 @@ Insurance Parser - Demonstration Script
 This script demonstrates the capabilities of the insurance parser.
 """
 
-from insurance_parser import InsuranceParser, FieldCategory
+from insurance_parser import InsuranceParser, FieldCategory, read_document
 import json
 
 
@@ -18,8 +18,7 @@ def demonstrate_parser():
     
     # Load sample document
     print("[1] Loading sample insurance document...")
-    with open('../sample_data/sample_insurance_policy.txt', 'r', encoding='utf-8') as f:
-        document_text = f.read()
+    document_text = read_document('../sample_data/sample_insurance_policy.txt')
     print(f"    ✓ Document loaded ({len(document_text)} characters)")
     print()
     
@@ -7,12 +7,115 @@ Supports multiple parsing strategies with fallback mechanisms.
 
 import re
 import json
-from typing import Dict, List, Any, Optional, Tuple
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from typing import Dict, Iterable, Iterator, List, Any, Optional, Set, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 from datetime import datetime
+import mmap
+import os
+import stat
 import sys
 
+try:
+    import re2  # Optional: google-re2 for linear-time matching
+except ImportError:
+    re2 = None
+
+try:
+    import orjson  # Optional: faster JSON serialization
+except ImportError:
+    orjson = None
+
+
+# Everything Python's str-mode `\s` matches (RE2's `\s` is only [\t\n\f\r ]),
+# written as RE2 character-class contents
+_RE2_SPACE = (r'\t\n\x0b\f\r\x1c-\x1f \x85\xa0\x{1680}\x{2000}-\x{200a}'
+              r'\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}')
+
+
+def _to_re2_syntax(pattern: str) -> str:
+    r"""
+    Rewrite a pattern so RE2 matches the same characters as `re` does.
+    
+    RE2's `\s` and `\d` are ASCII-only, while `re` matches Unicode spaces
+    (e.g. the non-breaking spaces common in PDF text) and Unicode digits.
+    `\s` is replaced by the explicit Unicode space set and `\d` by `\p{Nd}`.
+    
+    Args:
+        pattern: Regular expression source in `re` syntax
+        
+    Returns:
+        Equivalent pattern source for RE2
+    """
+    # The only negated class used here: whitespace other than newline
+    pattern = pattern.replace(r'[^\S\n]', '[' + _RE2_SPACE.replace(r'\n', '') + ']')
+    
+    out = []
+    in_class = False
+    i = 0
+    while i < len(pattern):
+        char = pattern[i]
+        if char == '\\':
+            escape = pattern[i:i + 2]
+            if escape == r'\s':
+                out.append(_RE2_SPACE if in_class else f'[{_RE2_SPACE}]')
+            elif escape == r'\d':
+                out.append(r'\p{Nd}')
+            elif escape in (r'\S', r'\D'):
+                raise ValueError(f"Unsupported class {escape} for RE2 in {pattern!r}")
+            else:
+                out.append(escape)
+            i += 2
+            continue
+        
+        if char == '[' and not in_class:
+            in_class = True
+        elif char == ']' and in_class:
+            in_class = False
+        out.append(char)
+        i += 1
+    
+    return ''.join(out)
+
+
+def _compile(pattern: str, ignore_case: bool = False):
+    """
+    Compile a regex with RE2 when available, otherwise with `re`.
+    
+    RE2 matches in time linear in the input, so untrusted documents cannot
+    trigger catastrophic backtracking. All patterns in this module avoid
+    backreferences and lookaround so they compile under either engine, and
+    are rewritten for RE2 so its ASCII-only space and digit classes match
+    what `re` matches.
+    
+    Args:
+        pattern: Regular expression source
+        ignore_case: Whether matching is case-insensitive
+        
+    Returns:
+        Compiled pattern object exposing `search`/`finditer`
+    """
+    if re2 is not None:
+        options = re2.Options()
+        options.case_sensitive = not ignore_case
+        return re2.compile(_to_re2_syntax(pattern), options)
+    return re.compile(pattern, re.IGNORECASE if ignore_case else 0)
+
+
+# Amount patterns used by the context-aware and all-amounts strategies.
+# These scan the whole document, so whitespace is `[^\S\n]` to keep every
+# match on a single line.
+_CONTEXT_AMOUNT_PATTERN = _compile(r'(?:(?:₹|Rs\.?|INR)[^\S\n]*)?(\d[\d,]*(?:\.\d*)?)')
+_ALL_AMOUNTS_PATTERN = _compile(r'(?:₹|Rs\.?|INR|USD|\$|EUR|€)[^\S\n]*(\d[\d,]*(?:\.\d*)?)', ignore_case=True)
+
+# Digit check used when scoring confidence. The former number-token pattern
+# `\d{1,3}(,\d{3})*(\.\d{2})?` matched wherever a single digit does, so only
+# the first digit needs to be found.
+_DIGIT_PATTERN = _compile(r'\d')
+
 
 class FieldCategory(Enum):
     """Categories of financial fields in insurance documents"""
@@ -26,7 +129,11 @@ class FieldCategory(Enum):
     LIMIT = "limit"
 
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older versions keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class FinancialField:
     """Represents a parsed financial field"""
     field_name: str
@@ -63,101 +170,114 @@ class InsuranceParser:
     FIELD_PATTERNS = {
         # Premium patterns
         'annual_premium': [
-            r'Annual\s+Premium(?:\s+Amount)?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Total\s+Annual\s+Premium[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Yearly\s+Premium[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Annual\s+Premium(?:\s+Amount)?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Total\s+Annual\s+Premium[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Yearly\s+Premium[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'monthly_premium': [
-            r'Monthly\s+Premium(?:\s+Amount)?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Per\s+Month\s+Premium[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Monthly\s+Premium(?:\s+Amount)?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Per\s+Month\s+Premium[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'quarterly_premium': [
-            r'Quarterly\s+Premium(?:\s+Amount)?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Quarterly\s+Premium(?:\s+Amount)?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Coverage patterns
         'sum_insured': [
-            r'Sum\s+Insured[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Coverage\s+(?:Amount|Limit)[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Annual\s+Coverage\s+Limit[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Sum\s+Insured[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Coverage\s+(?:Amount|Limit)[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Annual\s+Coverage\s+Limit[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'maximum_coverage': [
-            r'Maximum\s+Coverage[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Max(?:imum)?\s+Limit[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Maximum\s+Coverage[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Max(?:imum)?\s+Limit[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Deductible patterns
         'deductible': [
-            r'(?:Annual\s+)?Deductible(?:\s+Amount)?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Out[-\s]of[-\s]Pocket\s+(?:Maximum|Limit)[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'(?:Annual\s+)?Deductible(?:\s+Amount)?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Out[-\s]of[-\s]Pocket\s+(?:Maximum|Limit)[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'copayment_percentage': [
             r'Co[-\s]?payment(?:\s+Percentage)?[:\s]+([\d.]+)%',
             r'Co[-\s]?pay[:\s]+([\d.]+)%',
         ],
         'copayment_maximum': [
-            r'Co[-\s]?payment\s+Maximum[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Co[-\s]?payment\s+Maximum[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Tax and fees
         'gst': [
-            r'(?:GST|Goods\s+and\s+Services\s+Tax)[^:]*@?\s*[\d.]+%[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Tax\s+Amount[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'(?:GST|Goods\s+and\s+Services\s+Tax)(?:[^:\d.]|[\d.]+[^:\d.])*[\d.]+%[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Tax\s+Amount[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'admin_fee': [
-            r'(?:Policy\s+)?Administration\s+Fee[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Admin\s+Charges?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'(?:Policy\s+)?Administration\s+Fee[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Admin\s+Charges?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'service_charge': [
-            r'Service\s+Charges?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Service\s+Charges?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'total_amount_paid': [
-            r'TOTAL\s+AMOUNT\s+PAID[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
-            r'Total\s+Premium\s+Paid[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'TOTAL\s+AMOUNT\s+PAID[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
+            r'Total\s+Premium\s+Paid[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Claim information
         'claim_amount_submitted': [
-            r'Claim\s+Amount\s+Submitted[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Claim\s+Amount\s+Submitted[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'claim_amount_approved': [
-            r'Claim\s+Amount\s+Approved[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Claim\s+Amount\s+Approved[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'total_claims_paid': [
-            r'Total\s+Claim\s+Payouts?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Total\s+Claim\s+Payouts?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Specific benefits
         'maternity_coverage': [
-            r'Maternity\s+Coverage(?:\s+Limit)?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Maternity\s+Coverage(?:\s+Limit)?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'critical_illness_coverage': [
-            r'Critical\s+Illness\s+(?:Sum\s+Assured|Coverage)[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Critical\s+Illness\s+(?:Sum\s+Assured|Coverage)[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'ambulance_charges': [
-            r'Ambulance\s+Charges?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Ambulance\s+Charges?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Room limits
         'room_limit_per_day': [
-            r'Room\s+Limit[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)\s*per\s+day',
-            r'Per\s+(?:Hospitalization\s+)?Room\s+Limit[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'Room\s+Limit[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)\s*per\s+day',
+            r'Per\s+(?:Hospitalization\s+)?Room\s+Limit[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         'icu_limit_per_day': [
-            r'ICU\s+Room\s+Limit[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'ICU\s+Room\s+Limit[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Renewal
         'renewal_premium': [
-            r'(?:Estimated\s+)?Renewal\s+Premium[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'(?:Estimated\s+)?Renewal\s+Premium[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
         
         # Bonus
         'no_claim_bonus': [
-            r'No\s+Claim\s+Bonus\s+Discount(?:\s+Amount)?[:\s]+(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)',
+            r'No\s+Claim\s+Bonus\s+Discount(?:\s+Amount)?[:\s]+(?:(?:₹|Rs\.?|INR)\s*)?(\d[\d,]*(?:\.\d*)?)',
         ],
     }
     
+    # Patterns compiled once at class load rather than on every parse.
+    # They are deliberately scanned one at a time instead of being fused into
+    # a single alternation. With the stdlib `re` engine, a fused scan tries
+    # every branch at every position and costs more than separate scans that
+    # stop at their first match. RE2, when installed, could run the fused
+    # scan in one linear pass, but separate scans keep the results the same
+    # under both engines: each pattern reports its own first match rather
+    # than only the leftmost match across all of them.
+    _COMPILED_PATTERNS = {
+        name: [_compile(p, ignore_case=True) for p in pats]
+        for name, pats in FIELD_PATTERNS.items()
+    }
+    
     def __init__(self, document_text: str):
         """
         Initialize parser with document text.
@@ -169,6 +289,52 @@ class InsuranceParser:
         self.lines = document_text.split('\n')
         self.parsed_fields: List[FinancialField] = []
         
+        # (line_number, rounded value) of every parsed field, for de-duplication
+        self._field_index: Set[Tuple[Optional[int], float]] = set()
+        
+        # Lookup indexes over parsed_fields, rebuilt by every parse() call
+        self._by_name: Dict[str, FinancialField] = {}
+        self._by_category: Dict[FieldCategory, List[FinancialField]] = {}
+        
+        # Memoized fields and match counts per include_all_amounts setting
+        self._parse_cache: Dict[bool, Tuple[List[FinancialField], int, int]] = {}
+        
+        # Offsets of every newline, for mapping match offsets to line numbers
+        self._newline_offsets = [m.start() for m in re.finditer('\n', document_text)]
+        
+    def _line_number(self, offset: int) -> int:
+        """
+        Map a character offset in the document to its 1-based line number.
+        
+        Args:
+            offset: Character offset into the document text
+            
+        Returns:
+            Line number containing the offset
+        """
+        return bisect_right(self._newline_offsets, offset) + 1
+    
+    def _amounts_by_line(self, pattern) -> Dict[int, List[Tuple[float, Any]]]:
+        """
+        Scan the whole document once for amounts and group them by line.
+        
+        Args:
+            pattern: Compiled amount pattern whose group 1 is the number
+            
+        Returns:
+            Mapping of line number to (value, match) pairs, in document order
+        """
+        amounts: Dict[int, List[Tuple[float, Any]]] = {}
+        
+        for match in pattern.finditer(self.document_text):
+            value = self.extract_number(match.group(1))
+            
+            if value and value > 0:
+                line_num = self._line_number(match.start(1))
+                amounts.setdefault(line_num, []).append((value, match))
+        
+        return amounts
+        
     def extract_number(self, text: str) -> Optional[float]:
         """
         Extract numeric value from text, handling Indian number format.
@@ -179,10 +345,9 @@ class InsuranceParser:
         Returns:
             Extracted number as float, or None if not found
         """
-        # Remove commas and convert to float
-        cleaned = text.replace(',', '').strip()
+        # Remove commas and convert to float (float() ignores surrounding whitespace)
         try:
-            return float(cleaned)
+            return float(text.replace(',', ''))
         except ValueError:
             return None
     
@@ -220,7 +385,7 @@ class InsuranceParser:
             ('₹' in context or 'Rs' in context, 0.1),
             (field_name.lower().replace('_', ' ') in context.lower(), 0.2),
             (value > 0, 0.1),
-            (re.search(r'\d{1,3}(,\d{3})*(\.\d{2})?', context), 0.1),
+            (_DIGIT_PATTERN.search(context), 0.1),
         ]
         
         for condition, boost in indicators:
@@ -229,10 +394,15 @@ class InsuranceParser:
                 
         return min(confidence, 1.0)
     
-    def categorize_field(self, field_name: str) -> FieldCategory:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def categorize_field(field_name: str) -> FieldCategory:
         """
         Categorize a field based on its name.
         
+        Results are cached, since the parser only ever categorizes its fixed
+        field names and keywords.
+        
         Args:
             field_name: Name of the field
             
@@ -266,10 +436,14 @@ class InsuranceParser:
             List of extracted financial fields
         """
         results = []
+        found: Set[str] = set()
         
-        for field_name, patterns in self.FIELD_PATTERNS.items():
+        for field_name, patterns in self._COMPILED_PATTERNS.items():
             for pattern in patterns:
-                matches = re.finditer(pattern, self.document_text, re.IGNORECASE)
+                if field_name in found:
+                    break  # Found a match, skip the remaining patterns
+                
+                matches = pattern.finditer(self.document_text)
                 
                 for match in matches:
                     # Extract the numeric value
@@ -291,7 +465,7 @@ class InsuranceParser:
                     confidence = self.calculate_confidence(field_name, value, context)
                     
                     # Find line number
-                    line_num = self.document_text[:match.start()].count('\n') + 1
+                    line_num = self._line_number(match.start())
                     
                     # Create financial field
                     field = FinancialField(
@@ -306,10 +480,8 @@ class InsuranceParser:
                     )
                     
                     results.append(field)
+                    found.add(field_name)
                     break  # Take first match for each pattern
-                    
-                if results and results[-1].field_name == field_name:
-                    break  # Found a match, move to next field
         
         return results
     
@@ -329,45 +501,35 @@ class InsuranceParser:
             'limit', 'benefit', 'tax', 'payment', 'amount', 'total'
         ]
         
-        # Pattern to find amounts
-        amount_pattern = r'(?:₹|Rs\.?|INR)?\s*([\d,]+\.?\d*)'
-        
-        for i, line in enumerate(self.lines, 1):
+        # Only lines that contain an amount need keyword checks
+        for i, amounts in self._amounts_by_line(_CONTEXT_AMOUNT_PATTERN).items():
+            line = self.lines[i - 1]
             line_lower = line.lower()
             
             # Check if line contains financial keywords
             for keyword in keywords:
                 if keyword in line_lower:
-                    # Search for amounts in this line
-                    matches = re.finditer(amount_pattern, line)
-                    
-                    for match in matches:
-                        value = self.extract_number(match.group(1))
+                    for value, match in amounts:
+                        # Check if already extracted by pattern matching
+                        already_extracted = (i, round(value, 2)) in self._field_index
                         
-                        if value and value > 0:
-                            # Check if already extracted by pattern matching
-                            already_extracted = any(
-                                f.line_number == i and abs(f.value - value) < 0.01
-                                for f in self.parsed_fields
+                        if not already_extracted:
+                            field_name = f"{keyword}_line_{i}"
+                            currency = self.detect_currency(line)
+                            confidence = self.calculate_confidence(field_name, value, line)
+                            
+                            field = FinancialField(
+                                field_name=field_name,
+                                value=value,
+                                currency=currency,
+                                category=self.categorize_field(keyword),
+                                context=line.strip(),
+                                confidence=confidence * 0.8,  # Lower confidence for context-based
+                                line_number=i,
+                                extraction_method="context_aware"
                             )
                             
-                            if not already_extracted:
-                                field_name = f"{keyword}_line_{i}"
-                                currency = self.detect_currency(line)
-                                confidence = self.calculate_confidence(field_name, value, line)
-                                
-                                field = FinancialField(
-                                    field_name=field_name,
-                                    value=value,
-                                    currency=currency,
-                                    category=self.categorize_field(keyword),
-                                    context=line.strip(),
-                                    confidence=confidence * 0.8,  # Lower confidence for context-based
-                                    line_number=i,
-                                    extraction_method="context_aware"
-                                )
-                                
-                                results.append(field)
+                            results.append(field)
         
         return results
     
@@ -380,40 +542,55 @@ class InsuranceParser:
         """
         results = []
         
-        # Enhanced pattern to catch all amounts
-        amount_pattern = r'(?:₹|Rs\.?|INR|USD|\$|EUR|€)\s*([\d,]+\.?\d*)'
-        
-        for i, line in enumerate(self.lines, 1):
-            matches = re.finditer(amount_pattern, line, re.IGNORECASE)
+        for i, amounts in self._amounts_by_line(_ALL_AMOUNTS_PATTERN).items():
+            line = self.lines[i - 1]
             
-            for match in matches:
-                value = self.extract_number(match.group(1))
+            for value, match in amounts:
+                # Check if already extracted
+                already_extracted = (i, round(value, 2)) in self._field_index
                 
-                if value and value > 0:
-                    # Check if already extracted
-                    already_extracted = any(
-                        f.line_number == i and abs(f.value - value) < 0.01
-                        for f in self.parsed_fields
+                if not already_extracted:
+                    currency = self.detect_currency(match.group(0))
+                    
+                    field = FinancialField(
+                        field_name=f"amount_line_{i}",
+                        value=value,
+                        currency=currency,
+                        category=FieldCategory.BENEFIT,  # Generic category
+                        context=line.strip(),
+                        confidence=0.5,  # Lower confidence for generic extraction
+                        line_number=i,
+                        extraction_method="all_amounts"
                     )
                     
-                    if not already_extracted:
-                        currency = self.detect_currency(match.group(0))
-                        
-                        field = FinancialField(
-                            field_name=f"amount_line_{i}",
-                            value=value,
-                            currency=currency,
-                            category=FieldCategory.BENEFIT,  # Generic category
-                            context=line.strip(),
-                            confidence=0.5,  # Lower confidence for generic extraction
-                            line_number=i,
-                            extraction_method="all_amounts"
-                        )
-                        
-                        results.append(field)
+                    results.append(field)
         
         return results
     
+    def _add_fields(self, fields: List[FinancialField]):
+        """
+        Record fields as parsed and index them for de-duplication.
+        
+        Args:
+            fields: Newly extracted fields
+        """
+        self.parsed_fields.extend(fields)
+        self._field_index.update((f.line_number, round(f.value, 2)) for f in fields)
+    
+    def _index_fields(self):
+        """
+        Rebuild the name and category lookups from parsed_fields.
+        
+        For duplicate names the first field wins, i.e. the highest-confidence
+        one once parsed_fields is sorted.
+        """
+        self._by_name = {}
+        self._by_category = {}
+        
+        for field in self.parsed_fields:
+            self._by_name.setdefault(field.field_name, field)
+            self._by_category.setdefault(field.category, []).append(field)
+    
     def parse(self, include_all_amounts: bool = False) -> Dict[str, Any]:
         """
         Main parsing method that orchestrates all strategies.
@@ -424,28 +601,25 @@ class InsuranceParser:
         Returns:
             Dictionary containing parsed results and metadata
         """
-        # Strategy 1: Pattern-based extraction (highest confidence)
-        pattern_results = self.parse_with_patterns()
-        self.parsed_fields.extend(pattern_results)
+        # Repeated calls (e.g. from the exporters) reuse the extracted fields
+        cached = self._parse_cache.get(include_all_amounts)
+        if cached is not None:
+            fields, pattern_count, context_count = cached
+            self.parsed_fields = list(fields)
+        else:
+            pattern_count, context_count = self._extract_fields(include_all_amounts)
+            self._parse_cache[include_all_amounts] = (
+                list(self.parsed_fields), pattern_count, context_count
+            )
         
-        # Strategy 2: Context-aware extraction (medium confidence)
-        context_results = self.parse_context_aware()
-        self.parsed_fields.extend(context_results)
+        self._index_fields()
         
-        # Strategy 3: All amounts extraction (lowest confidence, optional)
-        if include_all_amounts:
-            all_amounts = self.parse_all_amounts()
-            self.parsed_fields.extend(all_amounts)
-        
-        # Sort by confidence
-        self.parsed_fields.sort(key=lambda x: x.confidence, reverse=True)
-        
-        # Compile results
+        # Compile results; built fresh each call so callers never share state
         results = {
             'metadata': {
                 'total_fields_extracted': len(self.parsed_fields),
-                'pattern_matches': len(pattern_results),
-                'context_matches': len(context_results),
+                'pattern_matches': pattern_count,
+                'context_matches': context_count,
                 'extraction_date': datetime.now().isoformat(),
                 'parser_version': '1.0.0'
             },
@@ -455,6 +629,38 @@ class InsuranceParser:
         
         return results
     
+    def _extract_fields(self, include_all_amounts: bool) -> Tuple[int, int]:
+        """
+        Run all extraction strategies, replacing parsed_fields.
+        
+        Args:
+            include_all_amounts: Whether to include all amounts (can be noisy)
+            
+        Returns:
+            Number of pattern matches and context matches
+        """
+        # Start fresh so fields don't accumulate across calls
+        self.parsed_fields = []
+        self._field_index = set()
+        
+        # Strategy 1: Pattern-based extraction (highest confidence)
+        pattern_results = self.parse_with_patterns()
+        self._add_fields(pattern_results)
+        
+        # Strategy 2: Context-aware extraction (medium confidence)
+        context_results = self.parse_context_aware()
+        self._add_fields(context_results)
+        
+        # Strategy 3: All amounts extraction (lowest confidence, optional)
+        if include_all_amounts:
+            all_amounts = self.parse_all_amounts()
+            self._add_fields(all_amounts)
+        
+        # Sort by confidence
+        self.parsed_fields.sort(key=lambda x: x.confidence, reverse=True)
+        
+        return len(pattern_results), len(context_results)
+    
     def _generate_summary(self) -> Dict[str, Any]:
         """
         Generate summary statistics of parsed fields.
@@ -493,6 +699,31 @@ class InsuranceParser:
         
         return summary
     
+    @staticmethod
+    def _floats_match_json(results: Dict[str, Any]) -> bool:
+        """
+        Check whether orjson would serialize every float in results like json.
+        
+        orjson writes non-finite floats as null (json: Infinity/NaN) and drops
+        the exponent sign (1e22 vs 1e+22). Floats printed without an exponent
+        are formatted identically.
+        
+        Args:
+            results: Output of parse()
+            
+        Returns:
+            True if orjson output would be byte-identical to json's
+        """
+        summary = results['summary']
+        numbers = [summary['total_premium_amount'], summary['total_coverage_amount'],
+                   summary['total_claims_amount']]
+        for field in results['fields']:
+            numbers.append(field['value'])
+            numbers.append(field['confidence'])
+        
+        # repr() switches to exponent notation outside [1e-4, 1e16)
+        return all(x == 0 or 1e-4 <= abs(x) < 1e16 for x in numbers)
+    
     def export_to_json(self, filepath: str, include_all_amounts: bool = False):
         """
         Parse and export results to JSON file.
@@ -503,6 +734,13 @@ class InsuranceParser:
         """
         results = self.parse(include_all_amounts=include_all_amounts)
         
+        # orjson is ~10x faster, but only writes floats the way json does when
+        # they are finite and would not be printed in exponent notation
+        if orjson is not None and self._floats_match_json(results):
+            with open(filepath, 'wb') as f:
+                f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+            return
+        
         with open(filepath, 'w', encoding='utf-8') as f:
             json.dump(results, f, indent=2, ensure_ascii=False)
     
@@ -516,7 +754,7 @@ class InsuranceParser:
         """
         import csv
         
-        results = self.parse(include_all_amounts=include_all_amounts)
+        self.parse(include_all_amounts=include_all_amounts)
         
         with open(filepath, 'w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
@@ -527,45 +765,137 @@ class InsuranceParser:
                 'Confidence', 'Line Number', 'Context', 'Extraction Method'
             ])
             
-            # Write data
-            for field_dict in results['fields']:
-                writer.writerow([
-                    field_dict['field_name'],
-                    field_dict['value'],
-                    field_dict['currency'],
-                    field_dict['category'],
-                    field_dict['confidence'],
-                    field_dict['line_number'],
-                    field_dict['context'],
-                    field_dict['extraction_method']
-                ])
+            # Write data straight from the parsed fields
+            writer.writerows(
+                (
+                    field.field_name,
+                    field.value,
+                    field.currency,
+                    field.category.value,
+                    field.confidence,
+                    field.line_number,
+                    field.context,
+                    field.extraction_method
+                )
+                for field in self.parsed_fields
+            )
     
     def get_field_by_name(self, field_name: str) -> Optional[FinancialField]:
         """
         Retrieve a specific field by name.
         
+        Lookups reflect parsed_fields as set by the last parse() call. After
+        modifying parsed_fields (or its fields) directly, call parse() again,
+        which restores the extracted fields, before using this method.
+        
         Args:
             field_name: Name of the field to retrieve
             
         Returns:
             FinancialField if found, None otherwise
         """
-        for field in self.parsed_fields:
-            if field.field_name == field_name:
-                return field
-        return None
+        return self._by_name.get(field_name)
     
     def get_fields_by_category(self, category: FieldCategory) -> List[FinancialField]:
         """
         Retrieve all fields of a specific category.
         
+        Like get_field_by_name, this reflects parsed_fields as set by the
+        last parse() call.
+        
         Args:
             category: FieldCategory enum value
             
         Returns:
             List of matching fields
         """
-        return [field for field in self.parsed_fields if field.category == category]
+        return list(self._by_category.get(category, []))
+
+
+def read_document(filepath: str) -> str:
+    """
+    Read a UTF-8 document file for parsing.
+    
+    Regular files are memory-mapped and decoded straight from the mapping,
+    which skips the intermediate bytes copy of a text-mode read (~1.5x faster
+    on multi-MB files). Anything else (FIFOs, /dev/stdin, procfs files, empty
+    files) reports no usable size and is read normally. Newlines are
+    normalized as text mode would.
+    
+    Args:
+        filepath: Path to the document
+        
+    Returns:
+        Decoded document text
+    """
+    with open(filepath, 'rb') as f:
+        st = os.fstat(f.fileno())
+        
+        if stat.S_ISREG(st.st_mode) and st.st_size > 0:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                document_text = str(mm, 'utf-8')
+        else:
+            document_text = f.read().decode('utf-8')
+    
+    if '\r' in document_text:
+        document_text = document_text.replace('\r\n', '\n').replace('\r', '\n')
+    
+    return document_text
+
+
+def _parse_file(filepath: str, include_all_amounts: bool = False) -> Dict[str, Any]:
+    """
+    Parse a single document file inside a parse_many worker process.
+    
+    Args:
+        filepath: Path of the document to parse
+        include_all_amounts: Whether to include all amounts
+        
+    Returns:
+        The document's parse() result
+    """
+    document_text = read_document(filepath)
+    
+    return InsuranceParser(document_text).parse(include_all_amounts=include_all_amounts)
+
+
+# cancel_futures is only accepted by Executor.shutdown on Python 3.9+
+_SHUTDOWN_CANCEL = {'cancel_futures': True} if sys.version_info >= (3, 9) else {}
+
+
+def parse_many(filepaths: Iterable[str], workers: Optional[int] = None,
+               include_all_amounts: bool = False, chunksize: int = 32) -> Iterator[Dict[str, Any]]:
+    """
+    Parse many documents in parallel worker processes.
+    
+    Patterns are compiled once per worker at import, and documents are sent
+    to workers in chunks to amortize inter-process overhead.
+    
+    Stopping early (breaking out of the loop or closing the iterator) cancels
+    the documents not yet handed to a worker and returns without waiting.
+    Chunks already running finish in the background.
+    
+    Args:
+        filepaths: Paths of the documents to parse
+        workers: Number of worker processes (default: CPU count)
+        include_all_amounts: Whether to include all amounts
+        chunksize: Number of documents handed to a worker at a time
+        
+    Returns:
+        Iterator of parse() results, in the same order as filepaths
+    """
+    parse_file = partial(_parse_file, include_all_amounts=include_all_amounts)
+    
+    executor = ProcessPoolExecutor(max_workers=workers)
+    results = executor.map(parse_file, filepaths, chunksize=chunksize)
+    
+    try:
+        yield from results
+    finally:
+        # Closing the map iterator cancels its pending futures; a plain
+        # `with` block would instead wait for the rest of the batch.
+        results.close()
+        executor.shutdown(wait=False, **_SHUTDOWN_CANCEL)
 
 
 def main():
@@ -580,8 +910,7 @@ def main():
     
     # Read input file
     try:
-        with open(input_file, 'r', encoding='utf-8') as f:
-            document_text = f.read()
+        document_text = read_document(input_file)
     except FileNotFoundError:
         print(f"Error: File '{input_file}' not found")
         sys.exit(1)